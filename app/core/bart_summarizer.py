@@ -1,49 +1,26 @@
 import time
-import torch
-from transformers import pipeline
+import logging
 from app.core.summarizer_base import SummarizerBase
-from app.config import config
+from app.core.smart_summarizer import SmartSummarizer
 
-# Log when model is created (for debugging)
-print("🔁 Initializing summarization pipeline...")
-
-# Auto-detect device: 0 for GPU (CUDA), -1 for CPU
-_device = 0 if torch.cuda.is_available() else -1
-_device_name = "GPU" if _device == 0 else "CPU"
-
-print(f"Loading model: {config.MODEL_NAME} on {_device_name}...")
-
-# Initialize the pipeline at module level (Singleton)
-_summarization_pipeline = pipeline(
-    "summarization",
-    model=config.MODEL_NAME,
-    tokenizer=config.MODEL_NAME,
-    framework="pt",
-    device=_device,
-)
-
-print("✅ Summarization pipeline initialized.")
+logger = logging.getLogger(__name__)
 
 class BARTSummarizer(SummarizerBase):
     """
-    Lightweight wrapper that reuses a single global pipeline instance.
+    Lightweight wrapper that delegates to the DistilBART pipeline cached by SmartSummarizer.
+    Nothing is loaded at import time, and no second copy of the model is kept.
     """
 
     def summarize(self, text: str, max_length: int, min_length: int) -> str:
         """
-        Summarize text using the global pipeline instance.
+        Summarize text using the shared DistilBART pipeline.
         """
-        start = time.time()
-        
-        # The pipeline returns a list of dicts: [{'summary_text': '...'}]
-        result = _summarization_pipeline(
-            text,
-            max_length=max_length,
-            min_length=min_length,
-            do_sample=False,
-        )
-        
-        elapsed = time.time() - start
-        print(f"⏱  summarize() took {elapsed:.2f}s")
-        
-        return result[0]['summary_text']
+        start = time.perf_counter()
+
+        # Goes through SmartSummarizer so the model's LRU eviction and inference thread stay in its control
+        summary = SmartSummarizer().summarize_with_model(text, max_length, min_length, "distilbart")
+
+        elapsed = time.perf_counter() - start
+        logger.info("⏱  summarize() took %.2fs", elapsed)
+
+        return summary
@@ -3,7 +3,14 @@ import logging
 import torch
 import asyncio
 import re
-from collections import Counter
+import os
+import gc
+import threading
+import weakref
+import numba
+import numpy as np
+from typing import Optional, Tuple
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from transformers import pipeline
 from app.config import config
@@ -12,80 +19,228 @@ from app.core.language_utils import detect_language
 
 logger = logging.getLogger(__name__)
 
+def configure_torch_threads():
+    """
+    Limits torch's inter-op pool to one thread. Request-level parallelism comes from
+    our executors, and nesting both pools oversubscribes the CPU.
+    Intra-op threads are set per device when SmartSummarizer is created.
+    """
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started
+        pass
+
+configure_torch_threads()
+
+# Precompiled patterns for the extractive summarizer (hot path for long English text)
+_SENT_SPLIT = re.compile(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s')
+_WORD_RE = re.compile(r'\w+')
+
+@numba.njit(cache=True)
+def _score_sentences(token_ids: np.ndarray, sent_offsets: np.ndarray, freq: np.ndarray) -> np.ndarray:
+    """
+    Sums the word frequencies of each sentence's tokens.
+    Sentence i owns token_ids[sent_offsets[i]:sent_offsets[i + 1]].
+    """
+    out = np.zeros(len(sent_offsets) - 1)
+    for i in range(len(sent_offsets) - 1):
+        s = 0
+        for j in range(sent_offsets[i], sent_offsets[i + 1]):
+            s += freq[token_ids[j]]
+        out[i] = s
+    return out
+
+# Compile the kernel at import so the first long-text request doesn't pay the JIT cost
+_score_sentences(np.zeros(1, dtype=np.int64), np.array([0, 1], dtype=np.int64), np.ones(1, dtype=np.int64))
+
+# Micro-batching: how long to wait for more requests, and the largest batch to run at once
+BATCH_WAIT_SECONDS = 0.015
+MAX_BATCH_SIZE = 8
+
 class SmartSummarizer(SummarizerBase):
     """
     Summarizer implementation that handles model routing and timeouts.
-    Uses eager loading for fast models and a hybrid approach for long text.
+    Eager-loads the default model (always kept in memory), keeps at most MAX_LOADED_MODELS
+    other pipelines, and uses a hybrid approach for long text.
     """
     _instance = None
-    _pipelines = {}
-    _executor = ThreadPoolExecutor(max_workers=1) # Dedicated thread for model inference
+    _lock = threading.Lock() # Guards singleton construction
+    _pipelines_lock = threading.Lock() # Guards the pipeline dict and load locks; never held while a model loads
+    _load_locks = {} # model name -> lock, so each model is loaded once without blocking requests for other models
+    _pipelines = OrderedDict() # model name -> pipeline, least recently used first
+    _executor = ThreadPoolExecutor(max_workers=1) # Shared inference thread on GPU
+    _fallback_executor = ThreadPoolExecutor(max_workers=1) # Runs the DistilBART fallback alongside slower models on GPU
+    _executors = {name: ThreadPoolExecutor(max_workers=1) for name in config.AVAILABLE_MODELS.values()} # Per-model threads on CPU
+    _batch_queues = weakref.WeakKeyDictionary() # event loop -> {(model name, max_length, min_length, executor): (queue, worker task)}
+    _batch_queues_lock = threading.Lock() # Guards the loop -> queues mapping (eviction runs off the loop)
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(SmartSummarizer, cls).__new__(cls)
-            
-            # Auto-detect device
-            cls._device = 0 if torch.cuda.is_available() else -1
-            cls._device_name = "GPU" if cls._device == 0 else "CPU"
-            logger.info(f"SmartSummarizer initialized. Device: {cls._device_name}")
-            
-            # Load fast models immediately to avoid delay on first request
-            cls._instance._eager_load_fast_models()
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(SmartSummarizer, cls).__new__(cls)
+                    
+                    # Auto-detect device
+                    cls._device = 0 if torch.cuda.is_available() else -1
+                    cls._device_name = "GPU" if cls._device == 0 else "CPU"
+                    cls._bf16_supported = cls._device == 0 and torch.cuda.is_bf16_supported()
+
+                    # On GPU one inference thread drives the device; on CPU each model gets its own
+                    # thread, so split the cores between two concurrently running models
+                    if cls._device == 0:
+                        torch.set_num_threads(1)
+                    else:
+                        torch.set_num_threads(max(1, (os.cpu_count() or 1) // 2))
+                    logger.info("SmartSummarizer initialized. Device: %s", cls._device_name)
+                    
+                    # Load the default model immediately to avoid delay on first request
+                    instance._eager_load_default_model()
+
+                    # Publish only once fully initialized
+                    cls._instance = instance
             
         return cls._instance
 
-    def _eager_load_fast_models(self):
+    def _eager_load_default_model(self):
         """
-        Loads fast models (DistilBART, T5) during startup.
+        Loads DistilBART during startup. Other models are loaded on first use.
         """
-        logger.info("Eager loading fast models...")
+        logger.info("Eager loading default model...")
         try:
             self._get_pipeline("distilbart")
-            self._get_pipeline("t5-small")
-            logger.info("Fast models loaded.")
+            logger.info("Default model loaded.")
         except Exception as e:
-            logger.error(f"Failed to eager load models: {e}")
+            logger.error("Failed to eager load models: %s", e)
 
-    def _get_pipeline(self, model_key: str):
+    def _evict_idle_pipelines(self):
         """
-        Loads the requested model pipeline if it's not already in memory.
+        Drops least recently used pipelines until at most MAX_LOADED_MODELS remain besides
+        DistilBART. DistilBART is the default and the fallback for every other model, so it is never evicted.
+        Must be called with _pipelines_lock held; returns the evicted model names.
+        """
+        pinned = config.AVAILABLE_MODELS["distilbart"]
+        evicted = []
+        while True:
+            evictable = [name for name in self._pipelines if name != pinned]
+            if len(evictable) <= config.MAX_LOADED_MODELS:
+                break
+            model_name = evictable[0]
+            del self._pipelines[model_name]
+            evicted.append(model_name)
+        return evicted
+
+    def _release_evicted(self, evicted):
+        """
+        Stops the batch workers of evicted models and frees their memory.
+        Runs outside _pipelines_lock so lookups of resident models aren't held up.
+        """
+        for model_name in evicted:
+            logger.info("Evicting idle model (%s).", model_name)
+            self._stop_batch_workers(model_name)
+        if evicted:
+            gc.collect()
+            if self._device == 0:
+                torch.cuda.empty_cache()
+
+    def _resolve_model_name(self, model_key: str) -> str:
+        """
+        Maps a model key to the model name that should serve it.
         Checks if advanced models are allowed on CPU.
         """
         # Safety Check for Advanced Models on CPU
         if model_key in config.SLOW_MODELS and self._device == -1:
             if not config.ENABLE_ADVANCED_MODELS_ON_CPU:
-                logger.warning(f"Advanced model '{model_key}' disabled on CPU. Routing to DistilBART.")
-                return self._get_pipeline("distilbart")
+                logger.warning("Advanced model '%s' disabled on CPU. Routing to DistilBART.", model_key)
+                return config.AVAILABLE_MODELS["distilbart"]
 
         model_name = config.AVAILABLE_MODELS.get(model_key)
         
         if not model_name:
-            logger.warning(f"Model key '{model_key}' not found. Falling back to default.")
+            logger.warning("Model key '%s' not found. Falling back to default.", model_key)
             model_name = config.ENGLISH_MODEL_NAME
+        return model_name
 
-        if model_name not in self._pipelines:
-            logger.info(f"Loading Model ({model_name})...")
-            start = time.time()
-            try:
+    def _torch_dtype(self, model_name: str):
+        """
+        Picks the weight dtype for a model. Half precision on GPU: BF16 where supported,
+        otherwise FP16 only for models that are stable in it (T5/Pegasus overflow in FP16).
+        """
+        if self._device != 0:
+            return torch.float32
+        if self._bf16_supported:
+            return torch.bfloat16
+        fp16_safe = {config.AVAILABLE_MODELS[key] for key in config.FP16_SAFE_MODELS}
+        return torch.float16 if model_name in fp16_safe else torch.float32
+
+    def _get_pipeline(self, model_key: str):
+        """
+        Loads the requested model pipeline if it's not already in memory.
+        """
+        return self._get_named_pipeline(model_key)[1]
+
+    def _get_named_pipeline(self, model_key: str):
+        """
+        Like _get_pipeline, but also returns the name of the model actually loaded
+        (which differs from the requested one after a load failure).
+        Returns (model_name, pipe).
+        """
+        return self._load_pipeline(self._resolve_model_name(model_key))
+
+    def _load_pipeline(self, model_name: str):
+        """
+        Returns (model_name, pipe) for an already resolved model name, loading it if needed.
+        Falls back to DistilBART if the model fails to load.
+        """
+        # Resident models are served under the short dict lock only
+        with self._pipelines_lock:
+            if model_name in self._pipelines:
+                self._pipelines.move_to_end(model_name)
+                return model_name, self._pipelines[model_name]
+            load_lock = self._load_locks.setdefault(model_name, threading.Lock())
+
+        try:
+            # Per-model lock so concurrent first requests don't load the same model twice,
+            # while requests for other models carry on
+            with load_lock:
+                with self._pipelines_lock:
+                    # Another thread may have finished loading it while we waited
+                    if model_name in self._pipelines:
+                        self._pipelines.move_to_end(model_name)
+                        return model_name, self._pipelines[model_name]
+
+                logger.info("Loading Model (%s)...", model_name)
+                start = time.perf_counter()
                 # Standard pipeline initialization
-                self._pipelines[model_name] = pipeline(
+                pipe = pipeline(
                     "summarization",
                     model=model_name,
                     tokenizer=model_name,
                     framework="pt",
-                    device=self._device
+                    device=self._device,
+                    torch_dtype=self._torch_dtype(model_name)
                 )
-                logger.info(f"Model ({model_name}) loaded in {time.time() - start:.2f}s")
-            except Exception as e:
-                logger.error(f"Failed to load model {model_name}: {e}")
-                # Fallback to DistilBART if specific model fails
-                if model_key != "distilbart":
-                     logger.info("Fallback to DistilBART due to load failure.")
-                     return self._get_pipeline("distilbart")
-                raise e
-        
-        return self._pipelines[model_name]
+                # truncation=True cuts input at model_max_length; make sure it never exceeds what the model accepts
+                max_positions = getattr(pipe.model.config, "max_position_embeddings", None)
+                if max_positions and pipe.tokenizer.model_max_length > max_positions:
+                    pipe.tokenizer.model_max_length = max_positions
+                if self._device == -1 and config.QUANTIZE_ON_CPU:
+                    # Dynamic int8 quantization of Linear layers (smaller weights, faster CPU matmuls)
+                    pipe.model = torch.quantization.quantize_dynamic(pipe.model, {torch.nn.Linear}, dtype=torch.qint8)
+                with self._pipelines_lock:
+                    self._pipelines[model_name] = pipe
+                    # Evict only once the new model is in, so a failed load doesn't drop a resident one
+                    evicted = self._evict_idle_pipelines()
+                self._release_evicted(evicted)
+                logger.info("Model (%s) loaded in %.2fs", model_name, time.perf_counter() - start)
+                return model_name, pipe
+        except Exception as e:
+            logger.error("Failed to load model %s: %s", model_name, e)
+            # Fallback to DistilBART if specific model fails (outside this model's load lock)
+            if model_name != config.AVAILABLE_MODELS["distilbart"]:
+                 logger.info("Fallback to DistilBART due to load failure.")
+                 return self._load_pipeline(config.AVAILABLE_MODELS["distilbart"])
+            raise e
 
     def _extractive_summarize(self, text: str, max_sentences: int = 5) -> str:
         """
@@ -93,53 +248,172 @@ class SmartSummarizer(SummarizerBase):
         Helps reduce very long text before passing it to the model.
         """
         try:
-            sentences = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s', text)
+            sentences = _SENT_SPLIT.split(text)
             if len(sentences) <= max_sentences:
                 return text
                 
-            words = re.findall(r'\w+', text.lower())
-            word_freq = Counter(words)
-            
-            # Score sentences based on word frequency
-            sentence_scores = {}
-            for sent in sentences:
-                for word in re.findall(r'\w+', sent.lower()):
-                    if word in word_freq:
-                        if len(sent.split()) < 30: # Skip very long sentences
-                            if sent not in sentence_scores:
-                                sentence_scores[sent] = word_freq[word]
-                            else:
-                                sentence_scores[sent] += word_freq[word]
-                                
-            # Select top N sentences
-            import heapq
-            summary_sentences = heapq.nlargest(max_sentences, sentence_scores, key=sentence_scores.get)
-            return ' '.join(summary_sentences)
+            # Tokenize each sentence once and map words to integer IDs
+            sent_tokens = [_WORD_RE.findall(sent.lower()) for sent in sentences]
+            vocab = {}
+            token_ids = np.fromiter(
+                (vocab.setdefault(word, len(vocab)) for tokens in sent_tokens for word in tokens),
+                dtype=np.int64
+            )
+            lengths = np.fromiter((len(tokens) for tokens in sent_tokens), dtype=np.int64, count=len(sent_tokens))
+            sent_offsets = np.zeros(len(sentences) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=sent_offsets[1:])
+
+            # Score sentences based on word frequency (compiled kernel)
+            freq = np.bincount(token_ids, minlength=len(vocab))
+            scores = _score_sentences(token_ids, sent_offsets, freq)
+            eligible = (lengths > 0) & (lengths < 30) # Skip empty and very long sentences
+            scores[~eligible] = -np.inf
+            eligible_count = int(eligible.sum())
+            if eligible_count == 0:
+                # Nothing scoreable; let the tokenizer truncate the original text instead
+                return text
+
+            # Select top N sentences (ties go to the earlier sentence), keeping original document order
+            top_k = min(max_sentences, eligible_count)
+            top = np.argsort(-scores, kind='stable')[:top_k]
+            return ' '.join(sentences[i] for i in sorted(top))
         except Exception as e:
-            logger.error(f"Extractive summarization failed: {e}")
+            logger.error("Extractive summarization failed: %s", e)
             return text[:2000] # Fallback to simple truncation
 
-    def _run_inference(self, pipe, text, max_length, min_length):
+    def _run_inference(self, pipe, texts, max_length, min_length):
         """
-        Runs inference in a separate thread.
+        Runs batched inference in a separate thread.
+        Returns one summary per input text.
         """
-        return pipe(
-            text,
-            max_length=max_length,
-            min_length=min_length,
-            truncation=True,
-            do_sample=False
-        )[0]['summary_text']
+        with torch.inference_mode():
+            results = pipe(
+                texts,
+                max_length=max_length,
+                min_length=min_length,
+                batch_size=len(texts),
+                truncation=True,
+                do_sample=False
+            )
+        return [result['summary_text'] for result in results]
 
-    async def summarize_async(self, text: str, max_length: int, min_length: int, model_key: str = "auto") -> str:
+    def _get_executor(self, model_name: str) -> ThreadPoolExecutor:
         """
-        Async summarization with timeout protection and auto-selection logic.
+        Returns the executor that runs inference for the given model.
+        GPU uses a single shared thread; CPU uses one thread per model so models don't queue behind each other.
+        """
+        if self._device == 0:
+            return self._executor
+        return self._executors.get(model_name, self._executor)
+
+    async def _batched_inference(self, model_name, pipe, text, max_length, min_length, executor=None) -> str:
+        """
+        Queues the text for inference and waits for its summary.
+        Concurrent requests for the same model and length settings share one pipeline call.
         """
-        start = time.time()
-        word_count = len(text.split())
-        lang = detect_language(text)
+        executor = executor or self._get_executor(model_name)
+        loop = asyncio.get_running_loop()
+        with self._batch_queues_lock:
+            queues = self._batch_queues.setdefault(loop, {})
+        key = (model_name, max_length, min_length, id(executor))
+        if key not in queues:
+            queue = asyncio.Queue()
+            worker = loop.create_task(self._batch_worker(queue, max_length, min_length, executor))
+            queues[key] = (queue, worker)
+
+        future = loop.create_future()
+        queues[key][0].put_nowait((pipe, text, future))
+        return await future
+
+    def _stop_batch_workers(self, model_name: str):
+        """
+        Retires the batch queues of an evicted model on every event loop.
+        Safe to call from any thread.
+        """
+        with self._batch_queues_lock:
+            loops = list(self._batch_queues.items())
+        for loop, queues in loops:
+            try:
+                loop.call_soon_threadsafe(self._drop_batch_queues, queues, model_name)
+            except RuntimeError:
+                # Loop already closed; its workers are gone with it
+                pass
+
+    @staticmethod
+    def _drop_batch_queues(queues: dict, model_name: str):
+        """
+        Runs on the queues' event loop. Unregisters the model's queues so new requests
+        get fresh ones, and tells each worker to exit once it has drained what is queued.
+        """
+        for key in [key for key in queues if key[0] == model_name]:
+            queue, _ = queues.pop(key)
+            queue.put_nowait(None)
+
+    async def _batch_worker(self, queue: asyncio.Queue, max_length: int, min_length: int, executor: ThreadPoolExecutor):
+        """
+        Collects queued requests for up to BATCH_WAIT_SECONDS and runs them as one batch.
+        Exits after a None entry (queued when the model is evicted).
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await queue.get()
+            if entry is None:
+                return
+            batch = [entry]
+            deadline = loop.time() + BATCH_WAIT_SECONDS
+            while len(batch) < MAX_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            # Drop requests whose callers already gave up (e.g. timed out)
+            batch = [entry for entry in batch if not entry[2].done()]
+            if not batch:
+                continue
+
+            pipe = batch[0][0]
+            texts = [text for _, text, _ in batch]
+            try:
+                summaries = await loop.run_in_executor(
+                    executor,
+                    self._run_inference,
+                    pipe, texts, max_length, min_length
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, _, future), summary in zip(batch, summaries):
+                    if not future.done():
+                        future.set_result(summary)
+            del pipe, batch
+
+    def _prepare(self, text: str, model_key: str, word_count: Optional[int] = None):
+        """
+        Shared routing for sync and async paths: picks the model, shortens long
+        English text, and loads the pipeline.
+        Returns (target_model_key, model_name, processed_text, pipe, degraded), where degraded
+        means a load failure forced a different model than the one routing picked.
+        """
+        if word_count is None:
+            word_count = len(text.split())
+        # Language only matters for auto-routing and the long-text path; skip detection otherwise
+        if model_key == "auto" or word_count > config.THRESHOLD_LONG:
+            lang = detect_language(text)
+        else:
+            lang = "en"
         
-        logger.info(f"Request: {word_count} words. Lang: {lang}. Model: {model_key}")
+        logger.info("Request: %d words. Lang: %s. Model: %s", word_count, lang, model_key)
 
         # 1. Auto-Detect Logic
         target_model_key = model_key
@@ -157,63 +431,129 @@ class SmartSummarizer(SummarizerBase):
         if word_count > config.THRESHOLD_LONG and lang == "en":
             logger.info("Text > 500 words. Running extractive summarization first.")
             processed_text = self._extractive_summarize(text, max_sentences=8)
-            logger.info(f"Reduced to {len(processed_text.split())} words.")
+            if logger.isEnabledFor(logging.INFO):
+                # Counting words allocates a list, so only do it when the message is emitted
+                logger.info("Reduced to %d words.", len(processed_text.split()))
 
         # 3. Select Pipeline
         try:
-            pipe = self._get_pipeline(target_model_key)
+            expected_name = self._resolve_model_name(target_model_key)
+            model_name, pipe = self._load_pipeline(expected_name)
+            degraded = model_name != expected_name
         except Exception as e:
-            logger.error(f"Failed to get pipeline for {target_model_key}: {e}")
+            logger.error("Failed to get pipeline for %s: %s", target_model_key, e)
             # Ultimate fallback
             target_model_key = "distilbart"
-            pipe = self._get_pipeline("distilbart")
+            model_name, pipe = self._get_named_pipeline("distilbart")
+            degraded = True
 
-        # 4. Run with Timeout
+        return target_model_key, model_name, processed_text, pipe, degraded
+
+    def _summarize_sync(self, text: str, max_length: int, min_length: int, model_key: str = "auto") -> str:
+        """
+        Synchronous summarization on the calling thread (no event loop, no timeout).
+        """
+        start = time.perf_counter()
+        _, _, processed_text, pipe, _ = self._prepare(text, model_key)
         try:
-            # 6-second timeout for model inference
-            loop = asyncio.get_event_loop()
-            summary = await asyncio.wait_for(
-                loop.run_in_executor(
-                    self._executor, 
-                    self._run_inference, 
-                    pipe, processed_text, max_length, min_length
-                ),
-                timeout=6.0
-            )
-            
-            elapsed = time.time() - start
-            logger.info(f"Summarization finished in {elapsed:.2f}s")
+            summary = self._run_inference(pipe, [processed_text], max_length, min_length)[0]
+            elapsed = time.perf_counter() - start
+            logger.info("Summarization finished in %.2fs", elapsed)
             return summary
+        except Exception as e:
+            logger.error("Inference failed: %s", e, exc_info=True)
+            return f"Error generating summary: {str(e)}. Here is a brief extract: " + self._extractive_summarize(text, max_sentences=2)
+
+    async def _fallback_inference(self, text: str, max_length: int, min_length: int) -> str:
+        """
+        Loads DistilBART if needed (off the event loop) and summarizes with it.
+        Runs as one task so the primary model never waits on the fallback's load.
+        """
+        loop = asyncio.get_running_loop()
+        fallback_name, fallback_pipe = await loop.run_in_executor(None, self._get_named_pipeline, "distilbart")
+        return await self._batched_inference(
+            fallback_name, fallback_pipe, text, max_length, min_length,
+            executor=self._fallback_executor if self._device == 0 else None
+        )
+
+    async def summarize_async(self, text: str, max_length: int, min_length: int, model_key: str = "auto",
+                              word_count: Optional[int] = None) -> Tuple[str, bool]:
+        """
+        Async summarization with timeout protection and auto-selection logic.
+        Pass word_count if the caller already counted the words, to avoid splitting the text again.
+        Returns (summary, degraded). degraded is True when the summary did not come from the
+        routed model (fallback model, extractive summary or error message), so callers
+        should not cache it.
+        """
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        # Routing may load (or reload after eviction) a model, which takes seconds; keep it off the event loop
+        target_model_key, model_name, processed_text, pipe, degraded = await loop.run_in_executor(
+            None, self._prepare, text, model_key, word_count
+        )
+
+        # 4. Run with Timeout
+        # 6-second timeout for model inference (fallback loading included); the primary model wins if it finishes in time
+        deadline = loop.time() + 6.0
+
+        # Slow models get a DistilBART fallback running concurrently on a separate executor, so
+        # they don't add fallback latency on top of their own timeout. Fast models run alone:
+        # a concurrent fallback would roughly double the inference work of the common path.
+        primary = asyncio.create_task(self._batched_inference(model_name, pipe, processed_text, max_length, min_length))
+        pending = {primary}
+        fallback = None
+        if target_model_key in config.SLOW_MODELS and model_name != config.AVAILABLE_MODELS["distilbart"]:
+            fallback = asyncio.create_task(self._fallback_inference(processed_text, max_length, min_length))
+            pending.add(fallback)
 
-        except asyncio.TimeoutError:
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, deadline - loop.time()),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                if fallback in done and fallback.exception() is not None:
+                    logger.warning("DistilBART fallback failed: %s", fallback.exception())
+                if primary in done and primary.exception() is None:
+                    elapsed = time.perf_counter() - start
+                    logger.info("Summarization finished in %.2fs", elapsed)
+                    return primary.result(), degraded
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if not primary.done():
             logger.warning("Model inference timed out (>6s).")
-            
-            # Fallback strategy
-            if target_model_key != "distilbart":
-                logger.info("Falling back to DistilBART (Fastest)...")
-                try:
-                    fallback_pipe = self._get_pipeline("distilbart")
-                    summary = await asyncio.wait_for(
-                        loop.run_in_executor(
-                            self._executor,
-                            self._run_inference,
-                            fallback_pipe, processed_text, max_length, min_length
-                        ),
-                        timeout=3.0 # Give fallback 3 seconds
-                    )
-                    return summary
-                except Exception:
-                    pass
-            
-            # Ultimate fallback: Return extractive summary
-            logger.warning("Fallback failed. Returning extractive summary.")
-            return self._extractive_summarize(text, max_sentences=3)
+        else:
+            logger.error("Inference failed: %s", primary.exception())
 
-        except Exception as e:
-            logger.error(f"Inference failed: {e}", exc_info=True)
+        # Fallback strategy
+        if fallback is not None and fallback.done() and not fallback.cancelled() and fallback.exception() is None:
+            logger.info("Using DistilBART (Fastest) fallback result.")
+            return fallback.result(), True
+
+        if primary.done() and not primary.cancelled():
             # Return a friendly error message or extractive summary instead of crashing
-            return f"Error generating summary: {str(e)}. Here is a brief extract: " + self._extractive_summarize(text, max_sentences=2)
+            e = primary.exception()
+            return f"Error generating summary: {str(e)}. Here is a brief extract: " + self._extractive_summarize(text, max_sentences=2), True
+
+        # Ultimate fallback: Return extractive summary
+        logger.warning("Fallback failed. Returning extractive summary.")
+        return self._extractive_summarize(text, max_sentences=3), True
 
     def summarize(self, text: str, max_length: int, min_length: int, model_key: str = "auto") -> str:
-        # Wrapper to run async code synchronously if needed
-        return asyncio.run(self.summarize_async(text, max_length, min_length, model_key))
+        # Synchronous entry point; runs inference directly instead of spinning up an event loop
+        return self._summarize_sync(text, max_length, min_length, model_key)
+
+    def summarize_with_model(self, text: str, max_length: int, min_length: int, model_key: str = "distilbart") -> str:
+        """
+        Summarizes text with a specific model, skipping language routing and preprocessing.
+        Inference runs on the model's executor, so it is serialized with the async path
+        instead of racing it on the caller's thread.
+        """
+        model_name, pipe = self._get_named_pipeline(model_key)
+        future = self._get_executor(model_name).submit(self._run_inference, pipe, [text], max_length, min_length)
+        return future.result()[0]
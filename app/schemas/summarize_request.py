@@ -5,7 +5,9 @@ class SummarizeRequest(BaseModel):
     """
     Request model for the summarization endpoint.
     """
-    text: str = Field(..., min_length=10, description="The text to summarize.")
+    text: str = Field(
+        ..., min_length=10, max_length=50_000, description="The text to summarize."
+    )
     length: Literal["short", "medium", "long"] = Field(
         "medium", description="Desired summary length preset."
     )
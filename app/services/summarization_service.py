@@ -1,3 +1,5 @@
+from hashlib import blake2b
+from cachetools import TTLCache
 from app.schemas.summarize_request import SummarizeRequest
 from app.schemas.summarize_response import SummarizeResponse
 from app.core.smart_summarizer import SmartSummarizer
@@ -6,43 +8,48 @@ from app.config import config
 # Instantiate smart summarizer (Singleton)
 _summarizer = SmartSummarizer()
 
-# Safety limit
-MAX_INPUT_CHARS = 4000 
+# Recent responses keyed by (text hash, length preset, model), so resubmits skip inference
+_summary_cache = TTLCache(maxsize=256, ttl=3600)
 
 async def summarize_text(request: SummarizeRequest) -> SummarizeResponse:
     """
     Service function to handle text summarization logic.
     Now Async to support timeouts.
     """
+    cache_key = (blake2b(request.text.encode()).hexdigest(), request.length, request.model)
+    cached = _summary_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Get length constraints
     length_settings = config.LENGTH_MAP.get(request.length, config.LENGTH_MAP["medium"])
     min_length = length_settings["min_length"]
     max_length = length_settings["max_length"]
 
-    # Truncate Input
-    text_to_process = request.text
-    if len(text_to_process) > MAX_INPUT_CHARS:
-        text_to_process = text_to_process[:MAX_INPUT_CHARS]
-        last_period = text_to_process.rfind('.')
-        if last_period > 0:
-            text_to_process = text_to_process[:last_period+1]
+    # Count words once; the summarizer reuses it for routing
+    original_word_count = len(request.text.split())
 
     # Perform summarization (Async)
-    summary_text = await _summarizer.summarize_async(
-        text_to_process, 
+    # Over-long input is truncated by the tokenizer at the model's max input length
+    summary_text, degraded = await _summarizer.summarize_async(
+        request.text,
         max_length=max_length, 
         min_length=min_length,
-        model_key=request.model
+        model_key=request.model,
+        word_count=original_word_count
     )
 
     # Calculate statistics
-    original_word_count = len(request.text.split())
     summary_word_count = len(summary_text.split())
     compression_ratio = summary_word_count / original_word_count if original_word_count > 0 else 0.0
 
-    return SummarizeResponse(
+    response = SummarizeResponse(
         summary=summary_text,
         original_word_count=original_word_count,
         summary_word_count=summary_word_count,
         compression_ratio=round(compression_ratio, 2)
     )
+    # Only cache real model output; fallbacks and errors may not recur on the next attempt
+    if not degraded:
+        _summary_cache[cache_key] = response
+    return response